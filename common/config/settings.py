@@ -102,6 +102,18 @@ class Settings(BaseSettings):
         default=None,
         validation_alias=AliasChoices("INDEX_FILES_ROOT_PATH", "INDEX_FILES_ROOT_PATH"))
 
+    # ===== Vectorstore build =====
+    # auto (= exact flat) | flat | ivfpq | sq_fp16 | sq8 | ivf_sq8 | hnsw | hnsw_sq_fp16 | opq_ivf_pq
+    # Anything but flat is approximate and shifts RAG/fallback scores (see tools/build_vectorstore.py)
+    vectorstore_index_type: str = Field(
+        default="auto",
+        validation_alias=AliasChoices("VECTORSTORE_INDEX_TYPE", "vectorstore_index_type"))
+
+    # HNSW candidates explored per query (recall vs latency); saved inside the index
+    vectorstore_hnsw_ef_search: int = Field(
+        default=64,
+        validation_alias=AliasChoices("VECTORSTORE_HNSW_EF_SEARCH", "vectorstore_hnsw_ef_search"))
+
     #
 
 @lru_cache
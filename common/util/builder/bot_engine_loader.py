@@ -1,4 +1,6 @@
 import os
+import pickle
+import faiss
 from dotenv import load_dotenv
 from langchain.chains import ConversationalRetrievalChain
 from langchain_community.vectorstores import FAISS
@@ -14,7 +16,31 @@ import importlib
 
 load_dotenv()
 
-_HYBRID_BOT_CACHE: Dict[Tuple[str, str], HybridBot] = {}  # (client_id, session_id) -> bot
+_HYBRID_BOT_CACHE: Dict[Tuple[str, str, str], HybridBot] = {}  # (client_id, session_id, prompt_name) -> bot
+
+
+def _load_faiss_vectorstore(vectorstore_path: Path, embeddings) -> FAISS:
+    """
+    Equivalent of FAISS.load_local (index.faiss + index.pkl). On POSIX the index is
+    opened with IO_FLAG_MMAP | IO_FLAG_READ_ONLY: IVF inverted lists stay memory-mapped
+    and are paged in on demand instead of being copied into RAM at startup, and rebuilds
+    are safe while serving because the builder swaps in new files with os.replace (this
+    mapping keeps the old inode). Elsewhere (Windows), or if the mmap read fails, the
+    index is read into RAM as before.
+    """
+    index_path = str(vectorstore_path / "index.faiss")
+    index = None
+    if os.name == "posix":
+        try:
+            index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError as ex:
+            print(f"⚠️ [VDB] mmap read of {index_path} failed ({ex}); reading into memory")
+    if index is None:
+        index = faiss.read_index(index_path)
+    # index.pkl comes from our own builder (same trust as allow_dangerous_deserialization=True)
+    with open(vectorstore_path / "index.pkl", "rb", buffering=1 << 20) as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    return FAISS(embeddings, index, docstore, index_to_docstore_id)
 
 
 def load_hybrid_bot(
@@ -37,11 +63,12 @@ def load_hybrid_bot(
 
     print(f"🤖 Loading hybrid bot strictly for client_id (full path): {client_id}")
 
-    # --- Cache key resolution ---
+    # --- Cache key resolution (prompt is part of the key: same index, different persona) ---
+    prompt_name = prompt_name or get_settings().chat_prompt
     if cache_scope == "session":
-        cache_key = (client_id, session_id or "__DEFAULT__")
+        cache_key = (client_id, session_id or "__DEFAULT__", prompt_name)
     else:
-        cache_key = (client_id, "__CLIENT__")
+        cache_key = (client_id, "__CLIENT__", prompt_name)
 
     if not force_reload and cache_key in _HYBRID_BOT_CACHE:
         return _HYBRID_BOT_CACHE[cache_key]
@@ -53,11 +80,7 @@ def load_hybrid_bot(
         raise FileNotFoundError(f"❌ Vectorstore not found at: {vectorstore_path}")
 
     emb = OpenAIEmbeddings()
-    vectordb = FAISS.load_local(
-        str(vectorstore_path),
-        emb,
-        allow_dangerous_deserialization=True
-    )
+    vectordb = _load_faiss_vectorstore(vectorstore_path, emb)
 
     try:
         ntotal = getattr(getattr(vectordb, "index", None), "ntotal", None)
@@ -68,7 +91,6 @@ def load_hybrid_bot(
     # --- Load prompt ---
     repo_root = Path(__file__).resolve().parents[3]
     prompts_path = repo_root / "prompts"
-    prompt_name = prompt_name or get_settings().chat_prompt
     print(f"🧠 Loading prompt '{prompt_name}' from {prompts_path}")
     prompt_loader = PromptLoader(str(prompts_path), prompt_name=prompt_name)
     prompt_bot = PromptBasedChatbot(prompt_loader, prompt_name=prompt_name)
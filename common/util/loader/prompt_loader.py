@@ -10,14 +10,16 @@ class PromptLoader:
     def _load_all_prompts(self):
         """Loads only the requested .txt prompt file from the given directory."""
         found = False
-        for file in os.listdir(self.prompts_path):
-            if file.endswith(".txt") and file.replace(".txt", "") == self.prompt_name:
-                found = True
-                prompt_name = file.replace(".txt", "")
-                with open(os.path.join(self.prompts_path, file), "r", encoding="utf-8") as f:
-                    self.prompts[prompt_name] = f.read()
-                    print(f"[PROMPT LOADER] Loaded prompt: {prompt_name} ({file}) ✅")
-                break  # Ya lo encontraste, no sigas iterando
+        with os.scandir(self.prompts_path) as entries:
+            for entry in entries:
+                file = entry.name
+                if file.endswith(".txt") and file.replace(".txt", "") == self.prompt_name:
+                    found = True
+                    prompt_name = file.replace(".txt", "")
+                    with open(entry.path, "r", encoding="utf-8") as f:
+                        self.prompts[prompt_name] = f.read()
+                        print(f"[PROMPT LOADER] Loaded prompt: {prompt_name} ({file}) ✅")
+                    break  # Ya lo encontraste, no sigas iterando
 
         if not found:
             raise FileNotFoundError(f"Prompt file '{self.prompt_name}.txt' not found in path '{self.prompts_path}'")
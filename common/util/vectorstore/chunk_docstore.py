@@ -0,0 +1,63 @@
+# common/util/vectorstore/chunk_docstore.py
+import operator
+from collections.abc import Iterator, Mapping
+from typing import List, Union
+from langchain_community.docstore.base import Docstore
+from langchain_core.documents import Document
+
+
+class ChunkDocstore(Docstore):
+    """
+    Read-only docstore backed by parallel lists of chunk texts and metadata dicts.
+    Docstore ids are the row numbers as strings ("0", "1", ...), so a lookup is a
+    list index instead of a str-keyed dict holding one entry per chunk.
+    Documents are built on lookup, so only retrieved chunks pay for one.
+    Written into index.pkl by tools/build_vectorstore.py and read back by
+    bot_engine_loader._load_faiss_vectorstore.
+    """
+
+    def __init__(self, texts: List[str], metadatas: List[dict]):
+        self.texts = texts
+        self.metadatas = metadatas
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def search(self, search: str) -> Union[str, Document]:
+        try:
+            i = int(search)
+            if i >= 0:
+                return Document(page_content=self.texts[i], metadata=self.metadatas[i])
+        except (ValueError, IndexError):
+            pass
+        # Same contract as InMemoryDocstore (negative ids are unknown, not "from the end")
+        return f"ID {search} not found."
+
+
+class RowIdMap(Mapping):
+    """
+    Read-only index_to_docstore_id for ChunkDocstore: row i -> "i".
+    Stands in for {i: str(i) for i in range(n)}; the id string is built on lookup,
+    so the map stores one int instead of n keys and n digit strings.
+    """
+
+    __slots__ = ("n",)
+
+    def __init__(self, n: int):
+        self.n = n
+
+    def __getitem__(self, i: int) -> str:
+        # FAISS search hands back numpy int64 rows; operator.index accepts those too
+        try:
+            row = operator.index(i)
+        except TypeError:
+            raise KeyError(i) from None
+        if 0 <= row < self.n:
+            return str(row)
+        raise KeyError(i)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.n))
+
+    def __len__(self) -> int:
+        return self.n
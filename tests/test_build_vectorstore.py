@@ -0,0 +1,97 @@
+# tests/test_build_vectorstore.py
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+
+import numpy as np
+
+import tools.build_vectorstore as bv
+from common.util.builder.bot_engine_loader import _load_faiss_vectorstore
+
+
+def _fake_splitter(monkeypatch):
+    # Deterministic split points: one chunk per "|"-separated segment
+    monkeypatch.setattr(bv, "_SPLITTER", SimpleNamespace(split_text=lambda t: t.split("|")))
+
+
+def test_split_drops_short_tail_chunks(monkeypatch):
+    _fake_splitter(monkeypatch)
+    body = "x" * bv.MIN_CHUNK_CHARS
+    dropped = Counter()
+
+    out = list(bv._iter_split_pairs([(f"{body}|p. 3", {"source": "a.txt"})], dropped))
+
+    assert out == [(body, {"source": "a.txt", "chunk": 0})]
+    assert dropped["short"] == 1
+
+
+def test_split_keeps_source_with_only_short_chunks(monkeypatch):
+    _fake_splitter(monkeypatch)
+    dropped = Counter()
+
+    out = list(bv._iter_split_pairs([("Opening hours: 9-18.", {"source": "faq.txt"}), ("", {})], dropped))
+
+    assert out == [("Opening hours: 9-18.", {"source": "faq.txt", "chunk": 0})]
+    assert dropped["short"] == 0
+    assert dropped["empty"] == 1
+
+
+class _ReverseOrderEmbeddings:
+    """Async fake: later batches finish first, so results arrive out of order."""
+
+    def __init__(self, texts, batch_size):
+        self.n_batches = -(-len(texts) // batch_size)
+        self.batch_of = {t: i // batch_size for i, t in enumerate(texts)}
+        self.finished = []
+
+    async def aembed_documents(self, batch):
+        b = self.batch_of[batch[0]]
+        await asyncio.sleep(0.01 * (self.n_batches - b))
+        self.finished.append(b)
+        return [[float(len(t)), float(ord(t[0]))] for t in batch]
+
+
+def test_embed_all_keeps_row_order_when_batches_finish_out_of_order():
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+    fake = _ReverseOrderEmbeddings(texts, batch_size=2)
+
+    out = asyncio.run(bv._embed_all(fake, texts, batch_size=2, concurrency=3))
+
+    assert fake.finished == [2, 1, 0]
+    assert out.dtype == np.float32
+    assert out.tolist() == [[float(len(t)), float(ord(t[0]))] for t in texts]
+
+
+def test_dedupe_slots_map_duplicates_back_to_their_vector():
+    chunks = [("a", {"chunk": 0}), ("bb", {"chunk": 1}), ("a", {"chunk": 2}),
+              ("ccc", {"chunk": 3}), ("bb", {"chunk": 4})]
+
+    texts, metadatas, unique_texts, slots = bv._dedupe_chunks(chunks)
+    assert texts == ["a", "bb", "a", "ccc", "bb"]
+    assert [m["chunk"] for m in metadatas] == [0, 1, 2, 3, 4]
+    assert unique_texts == ["a", "bb", "ccc"]
+    assert slots == [0, 1, 0, 2, 1]
+
+    fake = _ReverseOrderEmbeddings(unique_texts, batch_size=2)
+    vectors = asyncio.run(bv._embed_all(fake, unique_texts, batch_size=2))[slots]
+    # Row i of the index must be the vector of chunk i's text
+    assert vectors.tolist() == [[float(len(t)), float(ord(t[0]))] for t in texts]
+
+
+def test_vectorstore_round_trip(tmp_path):
+    # Builder output (ChunkDocstore + RowIdMap in index.pkl) read back by the bot loader
+    texts = ["alpha", "beta", "gamma", "delta"]
+    metadatas = [{"source": f"{t}.txt", "chunk": 0} for t in texts]
+    vectors = np.eye(len(texts), 8, dtype=np.float32)
+
+    index = bv._build_faiss_index(vectors, "flat")
+    bv._save_vectorstore(bv._to_langchain_faiss(index, None, texts, metadatas), tmp_path)
+    vectordb = _load_faiss_vectorstore(tmp_path, None)
+
+    hits = vectordb.similarity_search_with_score_by_vector(vectors[2].tolist(), k=2)
+    doc, score = hits[0]
+    assert doc.page_content == "gamma"
+    assert doc.metadata == {"source": "gamma.txt", "chunk": 0}
+    assert score == 0.0
+    assert hits[1][0].page_content != "gamma"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["index.faiss", "index.pkl"]
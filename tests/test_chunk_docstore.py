@@ -0,0 +1,42 @@
+# tests/test_chunk_docstore.py
+import pickle
+
+import numpy as np
+import pytest
+
+from common.util.vectorstore.chunk_docstore import ChunkDocstore, RowIdMap
+
+
+def test_chunk_docstore_search():
+    store = ChunkDocstore(["a", "b"], [{"chunk": 0}, {"chunk": 1}])
+
+    doc = store.search("1")
+    assert doc.page_content == "b"
+    assert doc.metadata == {"chunk": 1}
+    assert len(store) == 2
+
+
+def test_chunk_docstore_unknown_ids_not_found():
+    store = ChunkDocstore(["a", "b"], [{}, {}])
+
+    # Negative ids must not index from the end of the list
+    assert store.search("-1") == "ID -1 not found."
+    assert store.search("2") == "ID 2 not found."
+    assert store.search("x") == "ID x not found."
+
+
+def test_row_id_map_lookup():
+    ids = RowIdMap(3)
+
+    # FAISS search returns numpy int64 rows
+    assert ids[np.int64(2)] == "2"
+    assert ids[0] == "0"
+    assert len(ids) == 3
+    assert list(ids.items()) == [(0, "0"), (1, "1"), (2, "2")]
+    assert dict(pickle.loads(pickle.dumps(ids, protocol=pickle.HIGHEST_PROTOCOL))) == {0: "0", 1: "1", 2: "2"}
+
+
+@pytest.mark.parametrize("key", [3, -1, np.int64(-1), "1", 1.0, None])
+def test_row_id_map_rejects_unknown_keys(key):
+    with pytest.raises(KeyError):
+        RowIdMap(3)[key]
@@ -1,27 +1,13 @@
 # tests/test_goldens.py
-import json, os
+import json
 from types import SimpleNamespace
 from pathlib import Path
 import pytest
 
-from langchain_core.retrievers import BaseRetriever
-from langchain_core.documents import Document
 from common.util.builder.bot_engine_loader import load_hybrid_bot
 
-
-class SimpleRetriever(BaseRetriever):
-    """Simple retriever for testing: always returns docs if provided."""
-    docs: list
-
-    def _get_relevant_documents(self, query, *, run_manager=None):
-        def to_doc(d):
-            if isinstance(d, Document):
-                return d
-            return Document(page_content=getattr(d, "page_content", str(d)))
-        return [to_doc(d) for d in (self.docs or [])]
-
-    async def _aget_relevant_documents(self, query, *, run_manager=None):
-        return self._get_relevant_documents(query, run_manager=run_manager)
+# Builds real bots from vectorstores on disk and calls OpenAI
+pytestmark = pytest.mark.integration
 
 
 # Load golden cases
@@ -35,11 +21,11 @@ def _mark(flags, key):
 
 
 @pytest.mark.parametrize("case", GOLDENS, ids=[c["name"] for c in GOLDENS])
-def test_goldens_route(case):
-    # set prompt name
+def test_goldens_route(case, monkeypatch):
+    # set prompt name (monkeypatch restores the env after each case)
     prompt_name= case.get("prompt_name", "")
     print(f"Using PROMPT name {prompt_name}")
-    os.environ["ZBOT_PROMPT_NAME"] = prompt_name
+    monkeypatch.setenv("ZBOT_PROMPT_NAME", prompt_name)
     bot = load_hybrid_bot(case["client_id"],prompt_name=prompt_name,force_reload=True)
 
     # flags to track which path is used
@@ -1,17 +1,61 @@
-import json, os
+import json
 import pytest
 from common.util.builder.bot_engine_loader import load_hybrid_bot
 
+# Builds real bots from vectorstores on disk and calls OpenAI
+pytestmark = pytest.mark.integration
+
 # Load advanced golden cases
 with open("tests/golden_advanced.json", encoding="utf-8") as f:
     GOLDENS_ADV = json.load(f)
 
+# Keep cases that share a cached bot (client_id, prompt_name) next to each other
+GOLDENS_ADV.sort(key=lambda c: (c["client_id"], c.get("prompt_name", "")))
+
+# Cases with "no_cache": true in the JSON get the no_cache marker (fresh bot)
+GOLDENS_ADV_PARAMS = [
+    pytest.param(c, id=c["name"], marks=[pytest.mark.no_cache] if c.get("no_cache") else [])
+    for c in GOLDENS_ADV
+]
+
+
+def _reset_session(bot, monkeypatch) -> bool:
+    """
+    Start a cached bot from a clean session: chat memory, facts and (for the length of
+    the test) the answer cache. Returns False when its intent state can't be reset.
+    """
+    memory = getattr(getattr(bot, "chain", None), "memory", None)
+    if memory is not None:
+        memory.clear()
+    facts_store = getattr(bot, "facts_store", None)
+    if facts_store is not None:
+        facts_store.clear()
+    # Answers are cached by question text; turn the cache off instead of clearing it
+    # (CacheManager.clear() is a flushdb() on Redis, which may be shared with a live bot)
+    cache = getattr(bot, "cache", None)
+    if cache is not None:
+        monkeypatch.setattr(cache, "cache_enabled", False)
+    intent_logic = getattr(bot, "intent_logic", None)
+    if intent_logic is None:
+        return True
+    if not hasattr(intent_logic, "reset"):
+        # e.g. detectors holding _active / _active_detector mid-reprompt
+        return False
+    intent_logic.reset()
+    return True
+
 
-@pytest.mark.parametrize("case", GOLDENS_ADV, ids=[c["name"] for c in GOLDENS_ADV])
-def test_goldens_advanced(case):
+@pytest.mark.parametrize("case", GOLDENS_ADV_PARAMS)
+def test_goldens_advanced(case, monkeypatch, request):
     prompt_name = case.get("prompt_name", "")
-    os.environ["ZBOT_PROMPT_NAME"] = prompt_name
-    bot = load_hybrid_bot(case["client_id"], prompt_name=prompt_name, force_reload=True)
+    monkeypatch.setenv("ZBOT_PROMPT_NAME", prompt_name)
+    # Bots are cached per (client_id, prompt_name); no_cache cases force a fresh one
+    force_reload = request.node.get_closest_marker("no_cache") is not None
+    bot = load_hybrid_bot(case["client_id"], prompt_name=prompt_name, force_reload=force_reload)
+    if not _reset_session(bot, monkeypatch):
+        # Intent state without reset(): only a fresh bot is guaranteed clean
+        bot = load_hybrid_bot(case["client_id"], prompt_name=prompt_name, force_reload=True)
+        _reset_session(bot, monkeypatch)
 
     out = bot.handle(case["question"])
     mode = bot.last_metrics["mode"]
@@ -2,22 +2,27 @@
 from types import SimpleNamespace
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
+from pydantic import PrivateAttr
 from logic.pipeline.hybrid_bot import HybridBot
 
 class SimpleRetriever(BaseRetriever):
 
     # Pydantic field; no __init__ manual
     docs: list
+    _cached_docs: list = PrivateAttr(default=None)
+
+    def model_post_init(self, __context):
+        # docs never change after construction, so convert them once
+        self._cached_docs = [
+            d if isinstance(d, Document) else Document(page_content=getattr(d, "page_content", str(d)))
+            for d in (self.docs or [])
+        ]
 
     def _get_relevant_documents(self, query, *, run_manager=None):
-        def to_doc(d):
-            if isinstance(d, Document):
-                return d
-            return Document(page_content=getattr(d, "page_content", str(d)))
-        return [to_doc(d) for d in (self.docs or [])]
+        return self._cached_docs
 
     async def _aget_relevant_documents(self, query, *, run_manager=None):
-        return self._get_relevant_documents(query, run_manager=run_manager)
+        return self._cached_docs
 
 class FakeVectorDB:
     def __init__(self, docs):
@@ -1,6 +1,7 @@
 import pytest
 from common.util.builder.bot_engine_loader import load_hybrid_bot
 
+@pytest.mark.integration
 def test_hybrid_bot_load_and_respond():
     bot = load_hybrid_bot("demo_client")
     result = bot.ask("Test message")
@@ -6,8 +6,10 @@ E2E tests for the demo "send_transfer" intent using a fake LLM.
 - Validates: gate -> detect -> extract -> reprompt (ES) -> resume -> execute.
 """
 
+import json
+import re
 from types import SimpleNamespace
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Tuple
 
 from logic.intents.demos.intente_detection.intent_detection_logic_money_transfer import IntentDetectionLogicMoneyTransfer
 
@@ -28,16 +30,47 @@ def _last_user_content(messages: List[Any]) -> str:
     return getattr(last, "content", str(last))
 
 
+_USER_RE = re.compile(r"User message:\n(.*?)(?:\n\n|\Z)", re.DOTALL)
+
+# Include common Spanish flexions + currencies to reduce FNs in tests
+_TRANSFER_TRIGGERS = [
+    "mandar", "manda", "mandale", "mandá",
+    "enviar", "enviale", "enviarle",
+    "transferir", "transferile", "transferirle",
+    "pagar", "pagale", "págale",
+    "plata", "dinero", "guita",
+    "usd", "ars", "eur"
+]
+_TRANSFER_TRIGGERS_RE = re.compile("|".join(map(re.escape, _TRANSFER_TRIGGERS)))
+
+
+# Canned responses built once; FakeLLM hands back the same objects on every call
+_GATE_TRUE = SimpleNamespace(content='{"is_transfer": true}')
+_GATE_FALSE = SimpleNamespace(content='{"is_transfer": false}')
+_DETECT = SimpleNamespace(content='{"intent": "send_transfer", "confidence": 0.95}')
+_REPROMPT_AMOUNT = SimpleNamespace(content='{"reprompt": "¿Cuánto dinero te gustaría enviarle a Martina?"}')
+_REPROMPT_RECIPIENT = SimpleNamespace(content='{"reprompt": "¿A quién deseas enviar el dinero?"}')
+_REPROMPT_BOTH = SimpleNamespace(content='{"reprompt": "Necesito el monto y el destinatario."}')
+_EMPTY = SimpleNamespace(content="{}")
+_SLOT_CACHE: Dict[Tuple[Tuple[str, str], ...], SimpleNamespace] = {}
+
+
+def _slots_response(slots: Dict[str, str]) -> SimpleNamespace:
+    """Return the (cached) {"slots": {...}} response for a given slot dict."""
+    key = tuple(slots.items())
+    resp = _SLOT_CACHE.get(key)
+    if resp is None:
+        resp = _SLOT_CACHE[key] = SimpleNamespace(content='{"slots": %s}' % json.dumps(slots))
+    return resp
+
+
 def _extract_user_text_from_prompt(prompt: str) -> str:
     """
     Our prompts always include 'User message:\n{user_text}\n\n...'.
     For test fakes we parse that segment when present.
     """
-    marker = "User message:\n"
-    if marker in prompt:
-        body = prompt.split(marker, 1)[1]
-        return body.split("\n\n", 1)[0].strip()
-    return prompt.strip()
+    m = _USER_RE.search(prompt)
+    return m.group(1).strip() if m else prompt.strip()
 
 
 class FakeLLM:
@@ -53,22 +86,13 @@ class FakeLLM:
 
         # 1) Gate prompt -> expects {"is_transfer": true|false}
         if '{"is_transfer": true|false}' in content or '"is_transfer"' in content:
-            # Include common Spanish flexions + currencies to reduce FNs in tests
-            triggers = [
-                "mandar", "manda", "mandale", "mandá",
-                "enviar", "enviale", "enviarle",
-                "transferir", "transferile", "transferirle",
-                "pagar", "pagale", "págale",
-                "plata", "dinero", "guita",
-                "usd", "ars", "eur"
-            ]
-            is_transfer = any(t in user_text for t in triggers)
-            return SimpleNamespace(content='{"is_transfer": %s}' % ("true" if is_transfer else "false"))
+            is_transfer = _TRANSFER_TRIGGERS_RE.search(user_text) is not None
+            return _GATE_TRUE if is_transfer else _GATE_FALSE
 
         # 2) Detect prompt -> expects {"intent": "...", "confidence": ...}
         if '"intent"' in content and '"confidence"' in content and 'JSON' in content:
             # If the gate let us come here, just classify as send_transfer
-            return SimpleNamespace(content='{"intent": "send_transfer", "confidence": 0.95}')
+            return _DETECT
 
         # 3) Slot extraction prompt -> expects {"slots": {...}}
         if '"slots"' in content:
@@ -84,7 +108,7 @@ class FakeLLM:
                 slots["amount"] = "250 USD"
             if "150 usd" in user_text or "usd 150" in user_text:
                 slots["amount"] = "150 USD"
-            return SimpleNamespace(content='{"slots": %s}' % __import__("json").dumps(slots))
+            return _slots_response(slots)
 
         # 4) Reprompt builder -> expects {"reprompt": "..."}
         if '"reprompt"' in content:
@@ -92,13 +116,13 @@ class FakeLLM:
             ask_amount = "amount" in content or "monto" in content or "cantidad" in content
             ask_recipient = "recipient" in content or "destinatario" in content
             if ask_amount and not ask_recipient:
-                return SimpleNamespace(content='{"reprompt": "¿Cuánto dinero te gustaría enviarle a Martina?"}')
+                return _REPROMPT_AMOUNT
             if ask_recipient and not ask_amount:
-                return SimpleNamespace(content='{"reprompt": "¿A quién deseas enviar el dinero?"}')
-            return SimpleNamespace(content='{"reprompt": "Necesito el monto y el destinatario."}')
+                return _REPROMPT_RECIPIENT
+            return _REPROMPT_BOTH
 
         # Safety: if we ever miss a branch, return a valid empty JSON to avoid crashes
-        return SimpleNamespace(content="{}")
+        return _EMPTY
 
 
 # ------------------------------ Tests ------------------------------
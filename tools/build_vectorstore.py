@@ -1,35 +1,274 @@
 import os
+import asyncio
+import re
+import math
+import mmap
+import pickle
+import zipfile
+from xml.etree import ElementTree
+import faiss
+import numpy as np
 from dotenv import load_dotenv
 from pathlib import Path
-from typing import List
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from langchain_community.vectorstores import FAISS
 from langchain_community.embeddings import OpenAIEmbeddings
-from langchain_community.document_loaders import PyPDFLoader, TextLoader
+from langchain_community.document_loaders import PyPDFLoader
 from langchain.schema import Document
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-import docx2txt
 import json
+import orjson
 from langchain.schema import Document
 from common.config.settings import get_settings
+from common.util.vectorstore.chunk_docstore import ChunkDocstore, RowIdMap
 
 load_dotenv()
 
+PQ_SUBQUANTIZERS = 16
+IVF_NPROBE = 16
+
+# VECTORSTORE_INDEX_TYPE -> faiss.index_factory spec ("auto" is exact "flat"; everything
+# else is approximate and opt-in, since HybridBot gates RAG vs fallback on raw distances).
+# All specs use L2 since FAISS.load_local does not persist a distance strategy.
+_INDEX_SPECS = {
+    "flat": "Flat",
+    "ivfpq": "IVF{nlist},PQ" + str(PQ_SUBQUANTIZERS),
+    "sq_fp16": "SQfp16",  # half the bytes of flat, near-identical recall
+    "sq8": "SQ8",         # a quarter of the bytes, trained per-dimension ranges
+    "ivf_sq8": "IVF{nlist},SQ8",  # SQ8 codes behind an IVF coarse quantizer: 4x smaller and sub-linear search
+    "hnsw": "HNSW32",     # graph search, log-time queries, no training; stores full vectors + links
+    "hnsw_sq_fp16": "HNSW32,SQfp16",  # same graph over float16 storage: half the vector bytes
+    # Rotate + reduce to 128d, IVF with an HNSW coarse quantizer, 64-byte PQ codes (~100x smaller than flat)
+    "opq_ivf_pq": "OPQ64_128,IVF{nlist}_HNSW32,PQ64",
+}
+HNSW_EF_CONSTRUCTION = 200
+COMPRESSED_NPROBE = 64
+# Index types with an IVF coarse quantizer (need at least nlist training vectors)
+_IVF_INDEX_TYPES = {"ivfpq", "ivf_sq8", "opq_ivf_pq"}
+# Index types with 8-bit PQ codebooks (faiss trains 256 centroids per sub-quantizer)
+_PQ_INDEX_TYPES = {"ivfpq", "opq_ivf_pq"}
+PQ_TRAIN_MIN_VECTORS = 256
+# Trained indexes learn from at most this many vectors (random sample)
+TRAIN_SAMPLE_MAX = 262_144
+# Vectors are added in slices of this many rows (64k x 1536 float32 ~ 384 MB per call)
+ADD_BATCH_ROWS = 65_536
+# index.pkl is written through a 1 MiB buffer (pickle emits many small writes)
+PICKLE_BUFFER_BYTES = 1 << 20
+# Index types whose training faiss can run on a GPU
+_GPU_INDEX_TYPES = {"ivfpq", "ivf_sq8"}
+
+# Texts per embeddings request (also the client's chunk_size, so one batch = one HTTP call);
+# ~1000 chunks of <=900 chars stays well under the per-request token limit
+EMBED_BATCH_SIZE = 1000
+EMBED_MAX_RETRIES = 6
+# Worker processes that read/parse source files (PDF text extraction and JSON
+# re-serialization are CPU bound); progress is printed every LOAD_PROGRESS_EVERY files
+LOAD_MAX_WORKERS = min(32, os.cpu_count() or 1)
+LOAD_CHUNKSIZE = 8
+LOAD_PROGRESS_EVERY = 500
+# Batches kept in flight at once against the embeddings API
+EMBED_CONCURRENCY = 5
+
+# _clean: drop zero-width chars, collapse whitespace runs (one C-level pass each)
+_ZERO_WIDTH_TBL = str.maketrans("", "", "\u200b\u200c\u200d\ufeff")
+_WS_RE = re.compile(r"\s+")
+
+# Chunks shorter than this (page numbers, stray headers) are not worth a vector
+MIN_CHUNK_CHARS = 32
+# Built once and shared by every split (it is stateless)
+_SPLITTER = RecursiveCharacterTextSplitter(
+    chunk_size=900, chunk_overlap=150,
+    separators=["\n## ", "\n# ", "\n- ", "\n• ", "\n", " ", ""]
+)
+
+# WordprocessingML namespace + the .docx parts holding text, in docx2txt's order
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_PART_RE = re.compile(r"word/(?:(header)\d*|(document)|(footer)\d*)\.xml$")
+_DOCX_BREAKS = {_W_NS + "tab": "\t", _W_NS + "br": "\n", _W_NS + "cr": "\n", _W_NS + "p": "\n\n"}
+
 def _clean(text: str) -> str:
-    return " ".join(text.replace("\u200b", "").split())
+    if not text:
+        return ""
+    return _WS_RE.sub(" ", text.translate(_ZERO_WIDTH_TBL)).strip()
 
-def _split_docs(docs: List[Document]) -> List[Document]:
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=900, chunk_overlap=150,
-        separators=["\n## ", "\n# ", "\n- ", "\n• ", "\n", " ", ""]
-    )
-    chunks: List[Document] = []
-    for d in docs:
-        parts = splitter.split_text(_clean(d.page_content))
-        for i, p in enumerate(parts):
-            meta = dict(d.metadata)
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+def _iter_split_pairs(pairs: Iterable[Tuple[str, dict]],
+                      dropped: Optional[Counter] = None) -> Iterator[Tuple[str, dict]]:
+    """
+    Split (text, metadata) pairs into chunk pairs. The build pipeline stays on plain
+    tuples; Documents are only created when a chunk is read back from the docstore.
+    Empty sources are skipped; chunks under MIN_CHUNK_CHARS are dropped only when the
+    same source also produced a longer chunk (tail fragments), so a short source such
+    as a one-line FAQ is still indexed. Both are counted in `dropped`.
+    """
+    for text, metadata in pairs:
+        text = _clean(text)
+        if not text:
+            if dropped is not None:
+                dropped["empty"] += 1
+            continue
+        parts = _SPLITTER.split_text(text)
+        kept = [p for p in parts if len(p) >= MIN_CHUNK_CHARS] or parts
+        if dropped is not None:
+            dropped["short"] += len(parts) - len(kept)
+        for i, p in enumerate(kept):
+            meta = dict(metadata)
             meta["chunk"] = i
-            chunks.append(Document(page_content=p, metadata=meta))
-    return chunks
+            yield p, meta
+
+def _dedupe_chunks(chunks: Iterable[Tuple[str, dict]]) -> Tuple[List[str], List[dict], List[str], List[int]]:
+    """
+    Collapse chunks with identical text so each distinct text is embedded once.
+    Returns the chunk texts and metadatas, the unique texts and, for every chunk,
+    the index of its text in that list.
+    """
+    texts: List[str] = []
+    metadatas: List[dict] = []
+    unique_texts: List[str] = []
+    slot_by_text: Dict[str, int] = {}
+    slots: List[int] = []
+    for text, meta in chunks:
+        slot = slot_by_text.get(text)
+        if slot is None:
+            slot = slot_by_text[text] = len(unique_texts)
+            unique_texts.append(text)
+        slots.append(slot)
+        texts.append(text)
+        metadatas.append(meta)
+    return texts, metadatas, unique_texts, slots
+
+async def _embed_all(embeddings, texts: List[str], batch_size: int = EMBED_BATCH_SIZE,
+                     concurrency: int = EMBED_CONCURRENCY) -> np.ndarray:
+    """
+    Embed texts in batches with up to `concurrency` requests in flight.
+    Each batch is written straight into its rows of one preallocated float32
+    matrix, so row i is always texts[i] and there is no final vstack copy.
+    Rate limits (429 / Retry-After) are retried with backoff by the OpenAI
+    client itself (see EMBED_MAX_RETRIES).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    out: Optional[np.ndarray] = None
+
+    async def embed_batch(start: int, batch: List[str]) -> None:
+        nonlocal out
+        async with semaphore:
+            vectors = await embeddings.aembed_documents(batch)
+        if out is None:
+            out = np.empty((len(texts), len(vectors[0])), dtype=np.float32)
+        out[start:start + len(batch)] = vectors
+
+    await asyncio.gather(*(
+        embed_batch(i * batch_size, batch) for i, batch in enumerate(_batched(texts, batch_size))
+    ))
+    return out
+
+def _embed_texts(embeddings, texts: List[str]) -> np.ndarray:
+    """
+    Embed all texts concurrently into a single float32 matrix (row i = texts[i]).
+    """
+    return asyncio.run(_embed_all(embeddings, texts))
+
+def _train_and_add(index: faiss.Index, vectors: np.ndarray) -> None:
+    if not index.is_trained:
+        n = len(vectors)
+        if n > TRAIN_SAMPLE_MAX:
+            sample = np.random.default_rng(0).choice(n, TRAIN_SAMPLE_MAX, replace=False)
+            index.train(vectors[np.sort(sample)])
+        else:
+            index.train(vectors)
+    # Row slices of a C-contiguous matrix are contiguous views, so this copies nothing
+    for start in range(0, len(vectors), ADD_BATCH_ROWS):
+        index.add(vectors[start:start + ADD_BATCH_ROWS])
+
+def _build_faiss_index(vectors: np.ndarray, index_type: str = "auto", hnsw_ef_search: int = 64) -> faiss.Index:
+    """
+    Build the FAISS index for the chunk vectors according to index_type (see _INDEX_SPECS).
+    "auto" always builds the exact flat index; the compressed/approximate types must be
+    chosen explicitly and are checked against the corpus size before training.
+    IVF indexes are trained on the GPU when one is available.
+    Search-time knobs (nprobe, efSearch) are stored in the index file itself.
+    """
+    # FAISS wants C-contiguous float32; this is a no-op when the layout is already right
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    n, dim = vectors.shape
+    if index_type == "auto":
+        index_type = "flat"
+    spec = _INDEX_SPECS.get(index_type)
+    if spec is None:
+        raise ValueError(f"❌ Unknown VECTORSTORE_INDEX_TYPE '{index_type}'. Use one of: auto, {', '.join(_INDEX_SPECS)}")
+
+    nlist = int(4 * math.sqrt(n))
+    if index_type in _IVF_INDEX_TYPES and n < nlist:
+        raise ValueError(f"❌ VECTORSTORE_INDEX_TYPE '{index_type}' needs at least {nlist} vectors to train {nlist} IVF lists; got {n}. Use 'flat'.")
+    if index_type in _PQ_INDEX_TYPES and n < PQ_TRAIN_MIN_VECTORS:
+        raise ValueError(f"❌ VECTORSTORE_INDEX_TYPE '{index_type}' needs at least {PQ_TRAIN_MIN_VECTORS} vectors to train its PQ codebooks; got {n}. Use 'flat'.")
+    if index_type == "ivfpq" and dim % PQ_SUBQUANTIZERS:
+        raise ValueError(f"❌ VECTORSTORE_INDEX_TYPE 'ivfpq' needs a dimension divisible by {PQ_SUBQUANTIZERS}; got {dim}.")
+
+    index = faiss.index_factory(dim, spec.format(nlist=nlist))
+    if isinstance(index, faiss.IndexHNSW):
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = hnsw_ef_search
+    if index_type in _GPU_INDEX_TYPES and faiss.get_num_gpus() > 0:
+        gpu_index = faiss.index_cpu_to_gpu(faiss.StandardGpuResources(), 0, index)
+        _train_and_add(gpu_index, vectors)
+        index = faiss.index_gpu_to_cpu(gpu_index)
+    else:
+        _train_and_add(index, vectors)
+
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf.nprobe = COMPRESSED_NPROBE if index_type == "opq_ivf_pq" else IVF_NPROBE
+        quantizer = faiss.downcast_index(ivf.quantizer)
+        if isinstance(quantizer, faiss.IndexHNSW):
+            quantizer.hnsw.efSearch = hnsw_ef_search
+    return index
+
+def _to_langchain_faiss(index: faiss.Index, embeddings, texts: List[str], metadatas: List[dict]) -> FAISS:
+    """
+    Wrap a prebuilt FAISS index and its chunks into a LangChain vectorstore.
+    Row i of the index maps to texts[i] / metadatas[i] (docstore id str(i)).
+    """
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=ChunkDocstore(texts, metadatas),
+        index_to_docstore_id=RowIdMap(len(texts)),
+    )
+
+def _save_vectorstore(vectordb: FAISS, vectorstore_path: Path) -> None:
+    """
+    Write the same files as FAISS.save_local (index.faiss + index.pkl), but pickle
+    the docstore with the highest protocol, through a large write buffer.
+    Both files are written next to their targets and moved in with os.replace:
+    on POSIX a running bot keeps index.faiss memory-mapped (IO_FLAG_MMAP), and
+    truncating that file in place would pull the pages out from under it. (On
+    Windows the bot reads the index into RAM, so there is no mapping to protect.)
+    """
+    vectorstore_path.mkdir(parents=True, exist_ok=True)
+    index_path = vectorstore_path / "index.faiss"
+    pkl_path = vectorstore_path / "index.pkl"
+    tmp_index = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    tmp_pkl = pkl_path.with_name(f"{pkl_path.name}.{os.getpid()}.tmp")
+    try:
+        faiss.write_index(vectordb.index, str(tmp_index))
+        with open(tmp_pkl, "wb", buffering=PICKLE_BUFFER_BYTES) as f:
+            pickle.dump((vectordb.docstore, vectordb.index_to_docstore_id), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_index, index_path)
+        os.replace(tmp_pkl, pkl_path)
+    finally:
+        for tmp in (tmp_index, tmp_pkl):
+            if tmp.exists():
+                tmp.unlink()
 
 def load_json_curated(file_path: str) -> list[Document]:
     """
@@ -68,62 +307,123 @@ def load_json_curated(file_path: str) -> list[Document]:
         ))
     return docs
 
-def load_documents_from_folder(folder_path: str) -> list[Document]:
-    """
-    Recursive loader: walks through all subfolders and loads supported files.
-    """
-    docs: list[Document] = []
-    for root, _, files in os.walk(folder_path):
-        for filename in files:
-            full_path = os.path.join(root, filename)
-            if filename.lower().endswith(".pdf"):
-                loader = PyPDFLoader(full_path)
-                for d in loader.load():
-                    d.metadata.setdefault("source", filename)
-                    docs.append(d)
-
-            elif filename.lower().endswith(".txt"):
-                loader = TextLoader(full_path, encoding="utf-8")
-                for d in loader.load():
-                    d.metadata.setdefault("source", filename)
-                    docs.append(d)
-
-            elif filename.lower().endswith(".docx"):
-                try:
-                    raw = docx2txt.process(full_path)
-                    if raw.strip():
-                        docs.append(Document(page_content=raw, metadata={"source": filename}))
-                except Exception as e:
-                    print(f"❌ Error loading DOCX {filename}: {e}")
-            elif filename.lower().endswith(".json"):
-                try:
-                    with open(full_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    # Handle different possible JSON structures
-                    if isinstance(data, str):
-                        text = data
-                    elif isinstance(data, list):
-                        # Join list items into a single text block
-                        text = "\n".join(
-                            json.dumps(item) if isinstance(item, dict) else str(item)
-                            for item in data
-                        )
-                    elif isinstance(data, dict):
-                        # Dump dict as a string
-                        text = json.dumps(data)
-                    else:
-                        text = str(data)
-
-                    docs.append(Document(page_content=text, metadata={"source": filename}))
-
-                except Exception as e:
-                    print(f"❌ Error loading JSON {filename}: {e}")
-
-
-            else:
-                print(f"❌ Unsupported file format: {filename}")
-    return docs
+def _iter_files(folder_path: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield file entries under folder_path.
+    os.scandir hands back name/path/type from the directory listing itself,
+    so no extra stat or path join is needed per file.
+    """
+    pending = [folder_path]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+def _read_text_mmap(path: str) -> str:
+    """
+    Read a UTF-8 text file through a read-only mmap and decode straight from
+    the mapped pages, without first copying the file into a bytes object.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8")
+
+def _read_docx_text(path: str) -> str:
+    """
+    Extract text from a .docx (headers, body, footers) by streaming each XML
+    part through iterparse and clearing elements as they close.
+    """
+    texts: List[str] = []
+    with zipfile.ZipFile(path) as z:
+        parts = []
+        for name in z.namelist():
+            m = _DOCX_PART_RE.match(name)
+            if m:
+                parts.append((m.lastindex, name))
+        for _, name in sorted(parts):
+            with z.open(name) as f:
+                for _, elem in ElementTree.iterparse(f):
+                    if elem.tag == _W_NS + "t":
+                        texts.append(elem.text or "")
+                    elif elem.tag in _DOCX_BREAKS:
+                        texts.append(_DOCX_BREAKS[elem.tag])
+                    elem.clear()
+    return "".join(texts)
+
+def _load_file(filename: str, full_path: str) -> Optional[List[Tuple[str, dict]]]:
+    """
+    Load a single file into (text, metadata) pairs (empty list when it fails or has no text).
+    Returns None for unsupported formats so the caller can report them in bulk.
+    Runs in a worker process, so it hands back plain tuples and the parent builds Documents.
+    """
+    if filename.lower().endswith(".pdf"):
+        pairs = []
+        for d in PyPDFLoader(full_path).load():
+            d.metadata.setdefault("source", filename)
+            pairs.append((d.page_content, d.metadata))
+        return pairs
+
+    elif filename.lower().endswith(".txt"):
+        # Same metadata TextLoader would produce (source = full path)
+        return [(_read_text_mmap(full_path), {"source": full_path})]
+
+    elif filename.lower().endswith(".docx"):
+        try:
+            raw = _read_docx_text(full_path)
+            if raw.strip():
+                return [(raw, {"source": filename})]
+        except Exception as e:
+            print(f"❌ Error loading DOCX {filename}: {e}")
+    elif filename.lower().endswith(".json"):
+        try:
+            with open(full_path, "rb") as f:
+                data = orjson.loads(f.read())
+
+            # A bare JSON string is already text; lists, dicts and scalars are serialized in one call
+            text = data if isinstance(data, str) else orjson.dumps(data).decode()
+
+            return [(text, {"source": filename})]
+
+        except Exception as e:
+            print(f"❌ Error loading JSON {filename}: {e}")
+
+
+    else:
+        return None
+    return []
+
+def _iter_folder_pairs(folder_path: str) -> Iterator[Tuple[str, dict]]:
+    """
+    Recursive loader: walks through all subfolders and yields (text, metadata) pairs from supported files.
+    Files are parsed on a process pool, a bounded window at a time so the stream
+    never runs far ahead of the splitter; output order follows the walk.
+    """
+    files = [(entry.name, entry.path) for entry in _iter_files(folder_path)]
+    if not files:
+        return
+    processed = 0
+    unsupported: Counter = Counter()
+    with ProcessPoolExecutor(max_workers=min(LOAD_MAX_WORKERS, len(files))) as ex:
+        for window in _batched(files, LOAD_MAX_WORKERS * LOAD_CHUNKSIZE * 2):
+            results = ex.map(_load_file, *zip(*window), chunksize=LOAD_CHUNKSIZE)
+            for (filename, _), pairs in zip(window, results):
+                processed += 1
+                if pairs is None:
+                    unsupported[os.path.splitext(filename)[1].lower() or filename] += 1
+                else:
+                    yield from pairs
+                if processed % LOAD_PROGRESS_EVERY == 0:
+                    print(f"📄 Read {processed}/{len(files)} files…")
+
+    if unsupported:
+        detail = ", ".join(f"{ext}: {n}" for ext, n in unsupported.most_common())
+        print(f"❌ Skipped {sum(unsupported.values())} files with unsupported format ({detail})")
+    print(f"📄 Read {processed} files.")
 
 def build_vectorstore(client_id: str):
     # 🛠️ Normalize client_id to avoid hidden spaces or line breaks
@@ -133,26 +433,46 @@ def build_vectorstore(client_id: str):
     repo_root = Path(__file__).resolve().parents[1]
     doc_path = repo_root / "data" / "documents" / client_id
     vectorstore_path = repo_root / "vectorstores" / client_id
+    embedding_cache_path = repo_root / ".emb_cache" / client_id
 
     # 🛡️ Extra safety: fail early if documents folder does not exist
     if not doc_path.exists():
         raise FileNotFoundError(f"❌ Docs folder not found: {doc_path}")
 
-    print(f"📂 Loading documents from: {doc_path}")
-    raw_docs = load_documents_from_folder(str(doc_path))
-    if not raw_docs:
+    # 🌊 Stream files -> chunks so raw documents are never all held in memory
+    print(f"📂 Loading and splitting documents from: {doc_path}")
+    dropped: Counter = Counter()
+    chunks = _iter_split_pairs(_iter_folder_pairs(str(doc_path)), dropped)
+
+    # ♻️ Embed each distinct chunk text once; duplicates reuse the same vector
+    texts, metadatas, unique_texts, slots = _dedupe_chunks(chunks)
+    if not texts:
         print("⚠️ No documents found.")
         return
 
-    print(f"📄 Loaded {len(raw_docs)} raw docs. Splitting…")
-    documents = _split_docs(raw_docs)
-    print(f"🧩 Produced {len(documents)} chunks.")
+    print(f"🧩 Produced {len(texts)} chunks.")
+    print(f"🧹 Skipped {dropped['empty']} empty documents and {dropped['short']} tail chunks under {MIN_CHUNK_CHARS} chars.")
+    print(f"♻️ {len(texts) - len(unique_texts)} duplicate chunks skipped for embedding.")
 
-    embeddings = OpenAIEmbeddings()
-    vectordb = FAISS.from_documents(documents, embeddings)
+    # 💾 Chunk vectors are cached on disk by SHA-256 of their text: rebuilds only pay for new/changed chunks
+    embeddings = OpenAIEmbeddings(chunk_size=EMBED_BATCH_SIZE, max_retries=EMBED_MAX_RETRIES)
+    cached_embeddings = CacheBackedEmbeddings.from_bytes_store(
+        embeddings,
+        LocalFileStore(str(embedding_cache_path)),
+        namespace=embeddings.model,
+        key_encoder="sha256",
+    )
+    unique_vectors = _embed_texts(cached_embeddings, unique_texts)
+    settings = get_settings()
+    index = _build_faiss_index(
+        unique_vectors[slots],
+        settings.vectorstore_index_type,
+        hnsw_ef_search=settings.vectorstore_hnsw_ef_search,
+    )
+    print(f"🧮 Built {type(index).__name__} over {index.ntotal} vectors.")
+    vectordb = _to_langchain_faiss(index, embeddings, texts, metadatas)
 
-    vectorstore_path.mkdir(parents=True, exist_ok=True)
-    vectordb.save_local(str(vectorstore_path))
+    _save_vectorstore(vectordb, vectorstore_path)
     print(f"✅ Vectorstore saved to: {vectorstore_path}")
 
 if __name__ == "__main__":